@@ -0,0 +1,55 @@
+"""
+Benchmark time-to-first-prompt of the CLI.
+
+Starts `python main.py` and times how long it takes for the theme prompt to
+appear on stdout, compared with eagerly importing game and building a Game
+before prompting (how main.py used to start).
+
+Usage:
+    python bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROMPT = "What theme would you like"
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+EAGER = (
+    "from game import Game\n"
+    "from main import display\n"
+    "game = Game(display_callback=display)\n"
+    f"display({PROMPT!r})\n"
+)
+
+def time_to_prompt(args):
+    """Seconds from process start until the theme prompt is printed."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-u", *args],
+        cwd=HERE,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    try:
+        for line in process.stdout:
+            if PROMPT in line:
+                return time.perf_counter() - start
+        raise RuntimeError(f"Prompt never appeared: {' '.join(args)}")
+    finally:
+        process.kill()
+        process.wait()
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, args in [("eager", ["-c", EAGER]), ("lazy (main.py)", ["main.py"])]:
+        times = [time_to_prompt(args) for _ in range(runs)]
+        print(f"{label:>15}: median {statistics.median(times) * 1000:7.1f} ms "
+              f"(min {min(times) * 1000:.1f} ms, {runs} runs)")
+
+if __name__ == "__main__":
+    main()
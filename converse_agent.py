@@ -1,14 +1,39 @@
-import boto3, json, re
+import json, re, time
+from functools import lru_cache
+
+from request_scheduler import default_scheduler
+
+@lru_cache(maxsize=None)
+def get_bedrock_client(region):
+    """
+    Create the Bedrock Runtime client for a region once and share it.
+
+    boto3 is imported here rather than at module level because importing it
+    and building a client are the slowest parts of starting the game.
+    """
+    import boto3
+    from botocore.config import Config
+
+    # Retries are handled by the scheduler, so the client makes a single attempt
+    return boto3.client(
+        'bedrock-runtime',
+        region_name=region,
+        config=Config(retries={'max_attempts': 1, 'mode': 'standard'})
+    )
 
 class ConverseAgent:
-    def __init__(self, model_id, region='us-west-2', system_prompt='You are a helpful assistant.'):
+    def __init__(self, model_id, region='us-west-2', system_prompt='You are a helpful assistant.', client=None, scheduler=None):
         self.model_id = model_id
         self.region = region
-        self.client = boto3.client('bedrock-runtime', region_name=self.region)
+        self.client = client or get_bedrock_client(self.region)
+        self.scheduler = scheduler or default_scheduler
         self.system_prompt = system_prompt
         self.messages = []
         self.tools = None
         self.response_output_tags = [] # ['<response>', '</response>']
+        self.router = None # optional ModelRouter used to translate history per model
+        self.metrics = None # optional ModelMetrics recording each call
+        self.recorder = None # optional SessionRecorder logging each call
 
     def invoke_with_prompt(self, prompt):
         content = [
@@ -19,14 +44,23 @@ class ConverseAgent:
         return self.invoke(content)
 
     def invoke(self, content):
-        self.messages.append(
-            {
-                "role": "user", 
-                "content": content
-            }
-        )
-        response = self._get_converse_response()
-        return self._handle_response(response)
+        # Roll back everything appended during this call if it fails, so the
+        # history never ends with a toolUse that has no matching toolResult
+        checkpoint = len(self.messages)
+        try:
+            self.messages.append(
+                {
+                    "role": "user", 
+                    "content": content
+                }
+            )
+            response = self._get_converse_response()
+            return self._handle_response(response)
+        except Exception:
+            del self.messages[checkpoint:]
+            if self.recorder:
+                self.recorder.record_rollback(checkpoint)
+            raise
 
     def _get_converse_response(self):
         """
@@ -35,9 +69,16 @@ class ConverseAgent:
         
         # print(f"Invoking with messages: {json.dumps(self.messages, indent=2)}")
         
-        response = self.client.converse(
+        messages = self.messages
+        if self.router:
+            messages = self.router.translate_history(messages, self.model_id)
+
+        start = time.perf_counter()
+        response = self.scheduler.call(
+            self.model_id,
+            self.client.converse,
             modelId=self.model_id,
-            messages=self.messages,
+            messages=messages,
             system=[
                 {
                     "text": self.system_prompt
@@ -49,6 +90,11 @@ class ConverseAgent:
             },
             toolConfig=self.tools.get_tools()
         )
+        latency = time.perf_counter() - start
+        if self.metrics:
+            self.metrics.record_call(self.model_id, latency, response.get('usage'))
+        if self.recorder:
+            self.recorder.record_converse(self.model_id, self.messages, response, latency)
         return(response)
     
     def _handle_response(self, response):
@@ -88,13 +134,14 @@ class ConverseAgent:
                         tool_result = self.tools.execute_tool(tool_request)
                         tool_response.append({'toolResult': tool_result})
                 
-                return self.invoke(tool_response)
-                
             except KeyError as e:
                 raise ValueError(f"Missing required tool use field: {e}")
             except Exception as e:
                 raise ValueError(f"Failed to execute tool: {e}")
 
+            # Outside the try so model call errors (e.g. throttling) keep their type
+            return self.invoke(tool_response)
+
         elif stop_reason == 'max_tokens':
             # Hit token limit (this is one way to handle it.)
             self.invoke_with_prompt(self, 'Please continue.')
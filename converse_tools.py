@@ -1,19 +1,26 @@
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Optional
 import inspect
 import json
 
 class ConverseToolManager:
     def __init__(self):
         self._tools: Dict[str, Dict[str, Any]] = {}
+        self.recorder = None # optional SessionRecorder logging every tool call
     
-    def register_tool(self, name: str, func: Callable, description: str, input_schema: Dict):
+    def register_tool(self, name: str, func: Callable, description: str, input_schema: Dict,
+                      result_encoder: Optional[Callable[[Any], Any]] = None):
         """
         Register a new tool with the system
+
+        Args:
+            result_encoder: Optional callable that turns the raw result of func
+                into the compact value sent back to the model.
         """
         self._tools[name] = {
             'function': func,
             'description': description,
-            'input_schema': input_schema
+            'input_schema': input_schema,
+            'result_encoder': result_encoder
         }
 
     def get_tools(self) -> Dict[str, List[Dict]]:
@@ -42,6 +49,11 @@ class ConverseToolManager:
         Returns:
             Dict containing toolUseId and the tool's output
         """
+        if self.recorder:
+            return self.recorder.record_tool(payload, self._run_tool)
+        return self._run_tool(payload)
+
+    def _run_tool(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         tool_use_id = payload['toolUseId']
         tool_name = payload['name']
         tool_input = payload['input']
@@ -50,14 +62,14 @@ class ConverseToolManager:
             raise ValueError(f"Unknown tool: {tool_name}")
 
         try:
-            tool_func = self._tools[tool_name]['function']
-            result = tool_func(**tool_input)
-            
+            tool = self._tools[tool_name]
+            result = tool['function'](**tool_input)
+            if tool['result_encoder']:
+                result = tool['result_encoder'](result)
+
             return {
                 'toolUseId': tool_use_id,
-                'content': [{
-                    'text': str(result)
-                }],
+                'content': [self.format_result(result)],
                 'status': 'success'
             }
         except Exception as e:
@@ -69,6 +81,20 @@ class ConverseToolManager:
                 'status': 'error'
             }
 
+    @staticmethod
+    def format_result(result: Any) -> Dict[str, Any]:
+        """
+        Build a tool result content block for a value
+
+        Dicts and lists are sent as a 'json' block so the model receives
+        structured data instead of a Python repr; everything else is text.
+        """
+        if isinstance(result, dict):
+            return {'json': result}
+        if isinstance(result, (list, tuple)):
+            return {'json': {'result': list(result)}}
+        return {'text': str(result)}
+
     def clear_tools(self):
         """Clear all registered tools"""
         self._tools.clear()
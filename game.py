@@ -2,20 +2,67 @@ from converse_agent import ConverseAgent
 from converse_tools import ConverseToolManager
 from register_tools import register_game_tools
 from game_state import GameState
+from model_router import ModelRouter, ModelMetrics
+from session_log import SessionRecorder
+from functools import lru_cache
+import os
+import random
+import time
+
+@lru_cache(maxsize=None)
+def load_system_prompt(path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "system.txt")):
+    """Read the system prompt once and share it across Game instances"""
+    with open(path, "r") as f:
+        return f.read()
 
 class Game:
-    def __init__(self, model_id='anthropic.claude-3-5-haiku-20241022-v1:0', display_callback=None):
+    def __init__(self, model_id='anthropic.claude-3-5-haiku-20241022-v1:0', display_callback=None, small_model_id=None,
+                 text_only_models=(), prices=None, record_path=None):
+        """
+        Args:
+            model_id: Model used for world building and complex turns.
+            small_model_id: Optional faster model for simple commands; when
+                set, a ModelRouter picks the model for every turn.
+            text_only_models: Model ID prefixes that do not accept 'json' tool
+                results; their history is translated to text.
+            prices: Optional {model_id: (input_price_per_1k, output_price_per_1k)}
+                used for the cost in metrics.summary().
+            record_path: Optional file to record the session to, for replay
+                with replay_session.py.
+        """
         self.display_callback = display_callback
-        self.state = GameState(display_callback=self.game_state_display_callback)
+        seed = random.randrange(2**32) if record_path else None
+        self.state = GameState(display_callback=self.game_state_display_callback, seed=seed)
         self.tools = ConverseToolManager()
 
         # Setup agent
         register_game_tools(self.tools, self.state)
         self.agent = ConverseAgent(model_id=model_id)
-        self.agent.system_prompt = open("system.txt", "r").read()
+        self.agent.system_prompt = load_system_prompt()
         self.agent.tools = self.tools
         self.agent.response_output_tags = ['<response>', '</response>']
 
+        # Model tiering and per-model latency/cost metrics
+        self.metrics = ModelMetrics(prices)
+        self.router = None
+        if small_model_id or text_only_models:
+            # Without a small model the router always picks model_id, but still translates history
+            self.router = ModelRouter(small_model_id or model_id, model_id, text_only_models=tuple(text_only_models))
+        self.agent.router = self.router
+        self.agent.metrics = self.metrics
+
+        # Session recording
+        self.recorder = None
+        if record_path:
+            self.recorder = SessionRecorder(record_path, self.state, seed, model_id, self.agent.system_prompt)
+            self.agent.recorder = self.recorder
+            self.tools.recorder = self.recorder
+
+    def close(self):
+        """Release resources held by the game, such as the session log"""
+        if self.recorder:
+            self.recorder.close()
+
     def game_state_display_callback(self, message):
         """Callback to handle displaying tool responses to the user"""
         try:
@@ -30,27 +77,49 @@ class Game:
     def start_game(self, theme):
         """Initialize and start a new game with the given theme"""
         start_prompt = f"Start a {theme} themed adventure game."
-        return self.agent.invoke_with_prompt(start_prompt)
+        return self._invoke(start_prompt, world_building=True)
+
+    def _invoke(self, prompt, world_building=False):
+        """
+        Run one turn on the routed model and record its latency.
+
+        The turn is transactional: if it fails, the agent rolls back its
+        history and the game state is restored to how it was before the turn.
+        """
+        if self.router:
+            self.agent.model_id = self.router.route(prompt, self.metrics.last_input_tokens, world_building)
+        snapshot = self.state.snapshot()
+        if self.recorder:
+            self.recorder.record_turn()
+        start = time.perf_counter()
+        try:
+            response = self.agent.invoke_with_prompt(prompt)
+        except Exception:
+            self.state.restore(snapshot)
+            raise
+        self.metrics.record_turn(self.agent.model_id, time.perf_counter() - start)
+        return response
 
     def process_command(self, command):
         """Process a player command and return the response"""
         if not command:
             return None, None
             
-        response = self.agent.invoke_with_prompt(command)
+        response = self._invoke(command)
         
         # Get current info if available
         room_info = ""
         inventory_info = ""
         if self.state.player_id:
-            current_room = self.state.get_player_room(self.state.player_id)
-            if current_room:
-                room_desc = self.state.get_room_description(current_room)
-                room_info = f"{current_room}: {room_desc}"
-
-            # Get current player inventory
-            player_inventory = self.state.get_player_objects(self.state.player_id)
-            if player_inventory:
-                inventory_info += f"Inventory: {player_inventory}"
+            try:
+                surroundings = self.state.describe_surroundings(self.state.player_id)
+            except ValueError:
+                surroundings = None
+            if surroundings:
+                room_info = f"{surroundings['room']}: {surroundings['description']}"
+
+                # Get current player inventory
+                if surroundings['inventory']:
+                    inventory_info = f"Inventory: {','.join(surroundings['inventory'])}"
                 
-        return response, room_info, player_inventory
+        return response, room_info, inventory_info
@@ -2,10 +2,22 @@ import networkx as nx
 import random
 
 class GameState:
-    def __init__(self, display_callback=None):
+    def __init__(self, display_callback=None, seed=None):
         self.graph = nx.MultiDiGraph()
         self.player_id = None
         self.display_callback = display_callback
+        # Dice use their own generator so a session can be replayed from its seed
+        self.random = random.Random(seed)
+
+    def snapshot(self):
+        """Capture the game state so a failed turn can be undone with restore()."""
+        return (self.graph.copy(), self.player_id, self.random.getstate())
+
+    def restore(self, snapshot):
+        """Return the game state to a snapshot taken with snapshot()."""
+        graph, self.player_id, random_state = snapshot
+        self.graph = graph.copy()
+        self.random.setstate(random_state)
 
     def tool_response(func):
         """Decorator to format tool responses when callback is defined"""
@@ -164,7 +176,7 @@ class GameState:
                 node = edge[0]
                 if self.graph.nodes[node]['type'] == 'player':
                     players.append(node)
-        return ','.join(players)
+        return players
     
     @tool_response
     def get_room_npcs(self, room_id):
@@ -175,7 +187,7 @@ class GameState:
                 node = edge[0]
                 if self.graph.nodes[node]['type'] == 'npc':
                     npcs.append(node)
-        return ','.join(npcs)
+        return npcs
     
     @tool_response
     def get_player_objects(self, player_id):
@@ -184,7 +196,7 @@ class GameState:
         for edge in self.graph.edges(player_id, data=True):
             if edge[2]['type'] == 'holds':
                 objects.append(edge[1])
-        return ','.join(objects)
+        return objects
     
     @tool_response
     def get_room_objects(self, room_id):
@@ -195,7 +207,7 @@ class GameState:
                 node = edge[0]
                 if self.graph.nodes[node]['type'] == 'object':
                     objects.append(node)
-        return ','.join(objects)
+        return objects
     
     @tool_response
     def get_room_description(self, room_id):
@@ -229,6 +241,46 @@ class GameState:
                 exits[direction] = edge[1]  # edge[1] is the connected room
         return exits
     
+    @tool_response
+    def describe_surroundings(self, player_id):
+        """
+        Describe everything the player can see in a single pass over the graph:
+        the room, its exits, objects and NPCs, and the player's inventory.
+        """
+        room_id = None
+        inventory = []
+        for edge in self.graph.edges(player_id, data=True):
+            if edge[2]['type'] == 'located_in':
+                room_id = edge[1]
+            elif edge[2]['type'] == 'holds':
+                inventory.append(edge[1])
+        if room_id is None:
+            raise ValueError(f"Player '{player_id}' is not in a room.")
+
+        exits = {}
+        for edge in self.graph.edges(room_id, data=True):
+            if edge[2]['type'] == 'connected_to':
+                exits[edge[2]['direction']] = edge[1]
+
+        objects = []
+        npcs = []
+        for edge in self.graph.in_edges(room_id, data=True):
+            if edge[2]['type'] == 'located_in':
+                node_type = self.graph.nodes[edge[0]]['type']
+                if node_type == 'object':
+                    objects.append(edge[0])
+                elif node_type == 'npc':
+                    npcs.append(edge[0])
+
+        return {
+            'room': room_id,
+            'description': self.graph.nodes[room_id].get('description', 'None'),
+            'exits': exits,
+            'objects': objects,
+            'npcs': npcs,
+            'inventory': inventory
+        }
+    
     @tool_response
     def move_player_direction(self, player_id, direction):
         """Move the player in a specified direction if possible."""
@@ -244,7 +296,7 @@ class GameState:
     @tool_response
     def roll_dice(self, num_dice=1, num_sides=20):
         """Roll a number of dice with a given number of sides."""
-        rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
+        rolls = [self.random.randint(1, num_sides) for _ in range(num_dice)]
         total = sum(rolls)
         result = f"Rolled {total} ({num_dice}d{num_sides})"
         if num_dice > 1:
@@ -1,4 +1,5 @@
-from game import Game
+from concurrent.futures import ThreadPoolExecutor
+import os
 from colorama import init, Fore, Style
 
 # Initialize colorama
@@ -19,33 +20,59 @@ def display(message, type='info'):
         boxed_message = create_box(message)
         print(f"{Fore.YELLOW}{boxed_message}{Style.RESET_ALL}")
 
+def create_game():
+    # Imported here so boto3 and networkx load while the player picks a theme
+    from game import Game
+    # Set ADVENTURE_SESSION_LOG to record the session for replay_session.py
+    return Game(display_callback=display, record_path=os.environ.get('ADVENTURE_SESSION_LOG'))
+
 def main():
-    game = Game(display_callback=display)
+    # Build the game (and its Bedrock client) in the background
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_game = executor.submit(create_game)
+
+        # Get game theme from user
+        display("What theme would you like for your adventure game?\n(e.g. Fantasy, Star Fighter, Fantasy, Cyberpunk, Space Horror, etc.)")
+        theme = input(f"{Fore.GREEN}➜ {Style.RESET_ALL}").strip()
 
-    # Get game theme from user
-    display("What theme would you like for your adventure game?\n(e.g. Fantasy, Star Fighter, Fantasy, Cyberpunk, Space Horror, etc.)")
-    theme = input(f"{Fore.GREEN}➜ {Style.RESET_ALL}").strip()
+        game = pending_game.result()
 
-    # Start the game
-    response = game.start_game(theme)
-    display(response)
+    try:
+        # Start the game
+        while True:
+            try:
+                response = game.start_game(theme)
+                break
+            except Exception as e:
+                # The failed start was rolled back, so it is safe to try again
+                display(f"Something went wrong starting the game. ({e})\nPress Enter to try again (type 'exit' to quit)")
+                if input(f"{Fore.GREEN}➜ {Style.RESET_ALL}").strip() == 'exit':
+                    return
+        display(response)
 
-    # Main game loop
-    while True:
-        display("\nCommand (type 'exit' to quit)")
-        player_input = input(f"\n{Fore.GREEN}➜ {Style.RESET_ALL}").strip()
+        # Main game loop
+        while True:
+            display("\nCommand (type 'exit' to quit)")
+            player_input = input(f"\n{Fore.GREEN}➜ {Style.RESET_ALL}").strip()
 
-        if player_input != '':
+            if player_input != '':
 
-            if player_input == 'exit':
-                break
+                if player_input == 'exit':
+                    break
 
-            response, room_info, inventory_info = game.process_command(player_input)
-            display(response)
-            # if room_info:
-            #     display(room_info)
-            # if inventory_info:
-            #     display(inventory_info)
+                try:
+                    response, room_info, inventory_info = game.process_command(player_input)
+                except Exception as e:
+                    # The turn was rolled back, so the player can simply try again
+                    display(f"Something went wrong, please try again. ({e})")
+                    continue
+                display(response)
+                # if room_info:
+                #     display(room_info)
+                # if inventory_info:
+                #     display(inventory_info)
+    finally:
+        game.close()
 
 if __name__ == "__main__":
     main()
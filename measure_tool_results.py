@@ -0,0 +1,125 @@
+"""
+Measure how much the structured tool result encoding saves in input tokens
+per player turn, from a recorded session (see session_log.SessionRecorder,
+enabled with ADVENTURE_SESSION_LOG=path python main.py).
+
+Every toolResult stays in ConverseAgent.messages and is resent on each later
+converse call. For each player turn this reports the inputTokens the model
+actually billed, summed over the turn's calls, and an estimate of what the
+same calls would have cost with the legacy str(result) encoding. The legacy results are rebuilt by replaying
+the tool calls against a fresh GameState with the session's seed. The extra
+characters are converted to tokens using the session's own rate: how fast
+reported inputTokens grew compared with the size of the history sent.
+
+Usage:
+    python measure_tool_results.py session.jsonl
+"""
+import json
+import sys
+
+from converse_tools import ConverseToolManager
+from game_state import GameState
+from register_tools import register_game_tools
+from session_log import read_session
+
+DEFAULT_CHARS_PER_TOKEN = 4
+
+def _size(value):
+    return len(json.dumps(value, separators=(',', ':')))
+
+def legacy_extra_chars(tool, event):
+    """Characters the legacy text encoding adds over the recorded result."""
+    try:
+        raw = tool['function'](**event['input'])
+    except Exception as e:
+        raw = e
+    if event['status'] != 'success':
+        return 0 # errors were always sent as str(e)
+    if isinstance(raw, list):
+        raw = ','.join(raw) # list getters used to return comma-joined strings
+    return _size([{'text': str(raw)}]) - _size(event['result'])
+
+def measure(path):
+    """
+    Return one (turn, input_tokens, history_chars, extra_chars) tuple per
+    recorded converse call that reported usage. Turns are numbered from 1;
+    calls made before the first turn marker belong to turn 0.
+    """
+    turn = 0
+    state = None
+    tools = ConverseToolManager()
+    history = [] # messages as sent to the model
+    extras = [] # legacy extra characters per message in history
+    pending = 0 # extra characters of tool results not yet sent
+    turn_snapshot = None
+    calls = []
+
+    for event in read_session(path):
+        kind = event['e']
+        if kind == 'session':
+            state = GameState(seed=event['seed'])
+            register_game_tools(tools, state)
+        elif kind == 'turn':
+            turn += 1
+            turn_snapshot = state.snapshot()
+        elif kind == 'rollback':
+            del history[event['to']:]
+            del extras[event['to']:]
+            pending = 0
+            if turn_snapshot:
+                state.restore(turn_snapshot)
+        elif kind == 'tool':
+            pending += legacy_extra_chars(tools._tools[event['name']], event)
+        elif kind == 'converse':
+            del history[event['from']:]
+            del extras[event['from']:]
+            history.extend(event['new'])
+            # Tool results are all in the last (user) message of the call
+            extras.extend([0] * (len(event['new']) - 1) + [pending])
+            pending = 0
+            if event.get('usage'):
+                calls.append((turn, event['usage']['inputTokens'], _size(history), sum(extras)))
+            history.append(event['response'])
+            extras.append(0)
+    return calls
+
+def tokens_per_char(calls):
+    """Marginal input tokens per history character, fitted from the first and last call."""
+    (_, first_tokens, first_chars, _), (_, last_tokens, last_chars, _) = calls[0], calls[-1]
+    if last_chars > first_chars and last_tokens > first_tokens:
+        return (last_tokens - first_tokens) / (last_chars - first_chars), True
+    return 1 / DEFAULT_CHARS_PER_TOKEN, False
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python measure_tool_results.py session.jsonl")
+
+    calls = measure(sys.argv[1])
+    if not calls:
+        sys.exit("No converse calls with reported usage in the session")
+
+    rate, fitted = tokens_per_char(calls)
+
+    # Sum the calls of each turn, including the tool loop and failed attempts
+    turns = {}
+    for turn, input_tokens, _, extra_chars in calls:
+        totals = turns.setdefault(turn, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += input_tokens
+        totals[2] += input_tokens + round(extra_chars * rate)
+
+    print(f"{'turn':>4} {'calls':>6} {'input tok':>10} {'legacy est':>11} {'saved':>7}")
+    for turn, (count, measured, legacy) in sorted(turns.items()):
+        print(f"{turn:>4} {count:>6} {measured:>10} {legacy:>11} {legacy - measured:>7}")
+
+    total_measured = sum(totals[1] for totals in turns.values())
+    total_legacy = sum(totals[2] for totals in turns.values())
+    saved = total_legacy - total_measured
+    percent = 100 * saved / total_legacy if total_legacy else 0
+    source = "fitted from this session" if fitted else f"default {DEFAULT_CHARS_PER_TOKEN} chars/token"
+    print(f"\nInput tokens over {len(turns)} turns ({len(calls)} calls): {total_measured} measured vs "
+          f"{total_legacy} estimated legacy ({saved} saved, {percent:.1f}%, "
+          f"{saved / len(turns):.1f} per turn; {1 / rate:.2f} chars/token, {source})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import json
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+# Commands that usually need a state lookup or a single move, not new content
+SIMPLE_VERBS = {
+    'look', 'l', 'examine', 'x', 'inventory', 'i', 'go', 'move', 'walk', 'run',
+    'north', 'south', 'east', 'west', 'up', 'down', 'n', 's', 'e', 'w', 'u', 'd',
+    'take', 'get', 'grab', 'pick', 'drop', 'roll', 'wait',
+}
+
+class ModelRouter:
+    """
+    Pick a model per turn: a small, fast model for simple commands and a
+    larger model for world building and complex turns.
+
+    Heuristics:
+        - world building (start_game) always uses the large model
+        - commands starting with a simple verb and at most max_simple_words
+          words use the small model
+        - once the last call sent more than max_small_context input tokens
+          every turn uses the large model, which copes better with long
+          context
+    """
+
+    def __init__(self, small_model_id: str, large_model_id: str, max_simple_words: int = 6,
+                 max_small_context: int = 32000, text_only_models: Tuple[str, ...] = ()):
+        self.small_model_id = small_model_id
+        self.large_model_id = large_model_id
+        self.max_simple_words = max_simple_words
+        self.max_small_context = max_small_context
+        # Model ID prefixes that do not accept 'json' tool result blocks
+        self.text_only_models = text_only_models
+
+    def is_simple_command(self, prompt: str) -> bool:
+        """Whether a command is short and starts with a simple verb."""
+        words = prompt.lower().split()
+        return 0 < len(words) <= self.max_simple_words and words[0] in SIMPLE_VERBS
+
+    def route(self, prompt: str, context_tokens: int, world_building: bool = False) -> str:
+        """
+        Return the model ID to use for a turn.
+
+        Args:
+            context_tokens: Input tokens of the most recent call, a measure of
+                how much context the next call will send.
+        """
+        if world_building or context_tokens > self.max_small_context:
+            return self.large_model_id
+        if self.is_simple_command(prompt):
+            return self.small_model_id
+        return self.large_model_id
+
+    def translate_history(self, messages: List[Dict], model_id: str) -> List[Dict]:
+        """
+        Adapt the shared conversation history for a model.
+
+        The history is kept in Converse format for every model; only models
+        listed in text_only_models get their 'json' tool results rewritten as
+        text. The stored history is never modified.
+        """
+        if not self.text_only_models or not model_id.startswith(self.text_only_models):
+            return messages
+
+        translated = []
+        for message in messages:
+            content = []
+            for block in message['content']:
+                if 'toolResult' in block:
+                    result = block['toolResult']
+                    block = {'toolResult': {
+                        **result,
+                        'content': [
+                            {'text': json.dumps(item['json'], separators=(',', ':'))} if 'json' in item else item
+                            for item in result['content']
+                        ]
+                    }}
+                content.append(block)
+            translated.append({**message, 'content': content})
+        return translated
+
+class ModelMetrics:
+    """
+    Latency, token and cost metrics per model.
+
+    Args:
+        prices: Optional {model_id: (input_price_per_1k, output_price_per_1k)}
+            used to estimate cost; models without a price report a cost of 0.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.prices = prices or {}
+        self._calls: Dict[str, List[Dict[str, Any]]] = {}
+        self._turns: Dict[str, List[float]] = {}
+        self.last_input_tokens = 0 # input tokens of the most recent call, any model
+
+    def record_call(self, model_id: str, latency: float, usage: Optional[Dict] = None):
+        """Record one converse call."""
+        usage = usage or {}
+        self.last_input_tokens = usage.get('inputTokens', self.last_input_tokens)
+        self._calls.setdefault(model_id, []).append({
+            'latency': latency,
+            'input_tokens': usage.get('inputTokens', 0),
+            'output_tokens': usage.get('outputTokens', 0),
+        })
+
+    def record_turn(self, model_id: str, latency: float):
+        """Record one player turn, including every call in its tool loop."""
+        self._turns.setdefault(model_id, []).append(latency)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per model call/turn counts, p50/p90 turn latency, tokens and estimated cost."""
+        summary = {}
+        for model_id in sorted(set(self._calls) | set(self._turns)):
+            calls = self._calls.get(model_id, [])
+            turns = sorted(self._turns.get(model_id, []))
+            input_tokens = sum(c['input_tokens'] for c in calls)
+            output_tokens = sum(c['output_tokens'] for c in calls)
+            input_price, output_price = self.prices.get(model_id, (0.0, 0.0))
+            summary[model_id] = {
+                'calls': len(calls),
+                'turns': len(turns),
+                'p50_turn_latency': statistics.median(turns) if turns else None,
+                'p90_turn_latency': turns[int(0.9 * (len(turns) - 1))] if turns else None,
+                'input_tokens': input_tokens,
+                'output_tokens': output_tokens,
+                'cost': (input_tokens * input_price + output_tokens * output_price) / 1000,
+            }
+        return summary
@@ -2,11 +2,20 @@ from converse_tools import ConverseToolManager
 
 from game_state import GameState
 
+def _ack(result):
+    """Compact encoding for mutators whose confirmation only echoes the input."""
+    return 'ok'
+
+def _moved(result):
+    """Compact encoding for move_player_direction."""
+    return {'moved': bool(result)}
+
 def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     # Create Room Tool
     tools.register_tool(
         name="create_room",
         func=game_state.create_room,
+        result_encoder=_ack,
         description="Create a new room with a unique ID and optional description",
         input_schema={
             'json': {
@@ -24,6 +33,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="connect_rooms",
         func=game_state.connect_rooms,
+        result_encoder=_ack,
         description="Connect two rooms with directional paths",
         input_schema={
             'json': {
@@ -43,6 +53,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="create_player",
         func=game_state.create_player,
+        result_encoder=_ack,
         description="Create a new player character",
         input_schema={
             'json': {
@@ -60,6 +71,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="move_player",
         func=game_state.move_player,
+        result_encoder=_ack,
         description="Move a player to a specific room",
         input_schema={
             'json': {
@@ -77,6 +89,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="create_object",
         func=game_state.create_object,
+        result_encoder=_ack,
         description="Create a new object with a unique ID and name",
         input_schema={
             'json': {
@@ -94,6 +107,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="add_object_to_room",
         func=game_state.add_object_to_room,
+        result_encoder=_ack,
         description="Add an object to a specific room",
         input_schema={
             'json': {
@@ -111,6 +125,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="player_take_object",
         func=game_state.player_take_object,
+        result_encoder=_ack,
         description="Player picks up an object from their current room",
         input_schema={
             'json': {
@@ -128,6 +143,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="player_drop_object",
         func=game_state.player_drop_object,
+        result_encoder=_ack,
         description="Player drops an object in their current room",
         input_schema={
             'json': {
@@ -173,10 +189,27 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
         }
     )
 
+    # Describe Surroundings Tool
+    tools.register_tool(
+        name="describe_surroundings",
+        func=game_state.describe_surroundings,
+        description="Get the player's current room, its description, exits, objects and NPCs, and the player's inventory in one call",
+        input_schema={
+            'json': {
+                "type": "object",
+                "properties": {
+                    "player_id": {"type": "string"}
+                },
+                "required": ["player_id"]
+            }
+        }
+    )
+
     # Move Player Direction Tool
     tools.register_tool(
         name="move_player_direction",
         func=game_state.move_player_direction,
+        result_encoder=_moved,
         description="Move a player in a specific direction if possible",
         input_schema={
             'json': {
@@ -194,6 +227,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="create_npc",
         func=game_state.create_npc,
+        result_encoder=_ack,
         description="Create a new NPC with a unique ID and name",
         input_schema={
             'json': {
@@ -211,6 +245,7 @@ def register_game_tools(tools: ConverseToolManager, game_state: GameState):
     tools.register_tool(
         name="move_npc",
         func=game_state.move_npc,
+        result_encoder=_ack,
         description="Move an NPC to a specific room",
         input_schema={
             'json': {
@@ -0,0 +1,157 @@
+"""
+Replay the tool side of a recorded session without calling the model.
+
+Every tool call in a session log (see session_log.SessionRecorder, enabled
+with ADVENTURE_SESSION_LOG=path python main.py) is re-executed in order
+against a fresh GameState seeded like the original, so dice rolls repeat
+exactly. Results and graph mutations are checked against the recording.
+
+Usage:
+    python replay_session.py session.jsonl [--repeat N] [--profile] [--tracemalloc] [--top N]
+
+--repeat replays the session N times (each against a fresh GameState) to get
+production-shaped workloads from a short recording; --profile runs the
+replay under cProfile and --tracemalloc reports allocation hot spots and
+memory growth across repeats.
+"""
+import argparse
+import cProfile
+import gc
+import pstats
+import time
+import tracemalloc
+
+from converse_tools import ConverseToolManager
+from game_state import GameState
+from register_tools import register_game_tools
+from session_log import graph_diff, graph_snapshot, read_session
+
+def load(path):
+    """
+    Return the seed and the events to replay from a recorded session: tool
+    calls, plus the turn and rollback markers needed to undo failed turns.
+    """
+    seed = None
+    events = []
+    for event in read_session(path):
+        if event['e'] == 'session':
+            if seed is not None:
+                raise ValueError(f"{path} contains more than one session")
+            seed = event['seed']
+        elif event['e'] in ('tool', 'turn', 'rollback'):
+            events.append(event)
+    return seed, events
+
+def replay(seed, events, check=True):
+    """
+    Re-execute the tool calls against a fresh GameState, restoring the state
+    at the start of the turn wherever a failed turn was rolled back.
+
+    Returns (timings, mismatches): seconds spent per tool name, and the calls
+    (by index among tool calls) whose result or mutations differ from the
+    recording.
+    """
+    state = GameState(seed=seed)
+    tools = ConverseToolManager()
+    register_game_tools(tools, state)
+
+    timings = {}
+    mismatches = []
+    turn_snapshot = None
+    i = 0
+    for event in events:
+        if event['e'] == 'turn':
+            turn_snapshot = state.snapshot()
+            continue
+        if event['e'] == 'rollback':
+            if turn_snapshot:
+                state.restore(turn_snapshot)
+            continue
+
+        payload = {'toolUseId': f'replay_{i}', 'name': event['name'], 'input': event['input']}
+        before = graph_snapshot(state) if check else None
+        start = time.perf_counter()
+        tool_result = tools.execute_tool(payload)
+        timings.setdefault(event['name'], []).append(time.perf_counter() - start)
+
+        if check:
+            mutations = graph_diff(before, graph_snapshot(state))
+            if tool_result['content'] != event['result'] or mutations != event['mutations']:
+                mismatches.append((i, event['name']))
+        i += 1
+    return timings, mismatches
+
+def print_timings(totals):
+    """Print {tool name: [calls, total seconds]} slowest first."""
+    print(f"{'tool':<24} {'calls':>6} {'total ms':>10} {'mean us':>9}")
+    for name, (count, total) in sorted(totals.items(), key=lambda item: -item[1][1]):
+        print(f"{name:<24} {count:>6} {total * 1000:>10.3f} {total / count * 1e6:>9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay and profile a recorded game session")
+    parser.add_argument('path')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--profile', action='store_true', help="run under cProfile")
+    parser.add_argument('--tracemalloc', action='store_true', help="report allocations and memory growth")
+    parser.add_argument('--top', type=int, default=15, help="number of profile/allocation entries to show")
+    args = parser.parse_args()
+
+    seed, events = load(args.path)
+    calls = sum(1 for event in events if event['e'] == 'tool')
+    print(f"Replaying {calls} tool calls (seed {seed}) x{args.repeat}")
+
+    # Verify once up front so the checks do not skew the timed runs
+    _, mismatches = replay(seed, events)
+    if mismatches:
+        print(f"{len(mismatches)} calls differ from the recording, first: {mismatches[:5]}")
+    else:
+        print("All tool results and mutations match the recording")
+
+    profiler = cProfile.Profile() if args.profile else None
+    if args.tracemalloc:
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+
+    # Running totals rather than every timing, so the harness itself does not
+    # grow from run to run and show up as memory growth
+    totals = {}
+    for run in range(args.repeat):
+        if profiler:
+            profiler.enable()
+        timings, _ = replay(seed, events, check=False)
+        if profiler:
+            profiler.disable()
+
+        for name, times in timings.items():
+            total = totals.setdefault(name, [0, 0.0])
+            total[0] += len(times)
+            total[1] += sum(times)
+        del timings
+        if args.tracemalloc:
+            # networkx graphs hold reference cycles; collect the previous runs'
+            # GameState so only memory that is really retained is counted
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            if run == 0:
+                first = current
+            if run == 0 or run == args.repeat - 1:
+                print(f"run {run + 1}: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB")
+
+    print()
+    print_timings(totals)
+
+    if profiler:
+        print()
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(args.top)
+
+    if args.tracemalloc:
+        if args.repeat > 1:
+            print(f"\nMemory growth after the first run: {(current - first) / 1024 / (args.repeat - 1):.2f} KiB per run")
+        print(f"\nTop {args.top} allocation sites since start:")
+        gc.collect()
+        for stat in tracemalloc.take_snapshot().compare_to(baseline, 'lineno')[:args.top]:
+            print(stat)
+        tracemalloc.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Error codes from the Bedrock Runtime API that are worth retrying
+THROTTLING_ERRORS = {'ThrottlingException', 'TooManyRequestsException'}
+TRANSIENT_ERRORS = {
+    'ServiceUnavailableException',
+    'InternalServerException',
+    'ModelNotReadyException',
+    'ModelTimeoutException',
+}
+
+def error_code(error: Exception) -> Optional[str]:
+    """Get the service error code from a botocore ClientError (or a fake with the same shape)."""
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        return response.get('Error', {}).get('Code')
+    return None
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Whether a failed call is worth retrying: throttling, transient service
+    errors, or connection errors and timeouts raised before a response.
+    """
+    # Imported here, only once a call has failed, to keep botocore off the startup path
+    from botocore.exceptions import ConnectionError as BotocoreConnectionError, HTTPClientError
+
+    if isinstance(error, (BotocoreConnectionError, HTTPClientError)):
+        return True
+    code = error_code(error)
+    return code in THROTTLING_ERRORS or code in TRANSIENT_ERRORS
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit shared by every caller, adjusted with AIMD:
+    halved on throttling, grown by one request per window of successes.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False):
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+class RequestScheduler:
+    """
+    Schedule model calls with per-model rate limiting, adaptive concurrency
+    and jittered exponential backoff on throttling and transient errors.
+
+    A single scheduler is meant to be shared by every ConverseAgent in the
+    process so they back off together; see default_scheduler.
+    """
+
+    def __init__(self, requests_per_second: float = 2.0, burst: int = 4, max_concurrency: int = 4,
+                 max_retries: int = 5, base_delay: float = 0.5, max_delay: float = 20.0,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic,
+                 jitter: Callable[[], float] = random.random):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.clock = clock
+        self.jitter = jitter
+        self.limiter = AdaptiveLimiter(max_concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, model_id: str) -> TokenBucket:
+        with self._lock:
+            if model_id not in self._buckets:
+                self._buckets[model_id] = TokenBucket(self.requests_per_second, self.burst, self.clock)
+            return self._buckets[model_id]
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter backoff delay for a retry attempt (0-based)."""
+        return min(self.max_delay, self.base_delay * 2 ** attempt) * self.jitter()
+
+    def call(self, model_id: str, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        Call func(**kwargs) for model_id, retrying retryable errors.
+
+        Raises the last error once max_retries is exhausted, or immediately
+        for errors that are not retryable.
+        """
+        attempt = 0
+        while True:
+            wait = self._bucket(model_id).reserve()
+            if wait > 0:
+                self.sleep(wait)
+
+            self.limiter.acquire()
+            throttled = False
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                throttled = error_code(e) in THROTTLING_ERRORS
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+            finally:
+                self.limiter.release(throttled=throttled)
+
+            self.sleep(self.backoff(attempt))
+            attempt += 1
+
+# Shared across every agent (and game session) in the process
+default_scheduler = RequestScheduler()
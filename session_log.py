@@ -0,0 +1,106 @@
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'), default=str)
+
+def graph_snapshot(state) -> Dict[str, set]:
+    """Hashable view of every node and edge in a GameState graph."""
+    graph = state.graph
+    return {
+        'nodes': {_dumps([node, data]) for node, data in graph.nodes(data=True)},
+        'edges': {_dumps([u, v, key, data]) for u, v, key, data in graph.edges(keys=True, data=True)},
+    }
+
+def graph_diff(before: Dict[str, set], after: Dict[str, set]) -> Dict[str, List]:
+    """Nodes and edges added or removed between two snapshots, omitting empty lists."""
+    diff = {}
+    for kind in ('nodes', 'edges'):
+        added = sorted(after[kind] - before[kind])
+        removed = sorted(before[kind] - after[kind])
+        if added:
+            diff[f'+{kind}'] = [json.loads(item) for item in added]
+        if removed:
+            diff[f'-{kind}'] = [json.loads(item) for item in removed]
+    return diff
+
+class SessionRecorder:
+    """
+    Record a game session as compact JSON Lines.
+
+    Events:
+        session   - the GameState random seed, model and system prompt
+        turn      - a player turn starts
+        rollback  - a failed turn was undone; the history was truncated to
+                    'to' messages and the game state restored to the start
+                    of the turn
+        converse  - messages added since the previous call, the response
+                    message, stop reason, usage and latency
+        tool      - tool name, input, result, status, latency and the
+                    GameState graph mutations it caused
+
+    Args:
+        path: File to write the log to; an existing file is replaced.
+        state: GameState whose mutations are recorded.
+    """
+
+    def __init__(self, path: str, state, seed: int, model_id: str = '', system_prompt: str = ''):
+        self.state = state
+        self._file = open(path, 'w')
+        self._sent = 0 # messages already written by earlier converse events
+        self._write({'e': 'session', 'seed': seed, 'model': model_id, 'system': system_prompt, 't': time.time()})
+
+    def _write(self, event: Dict[str, Any]):
+        self._file.write(_dumps(event) + '\n')
+        self._file.flush()
+
+    def record_turn(self):
+        """Mark the start of a player turn."""
+        self._write({'e': 'turn'})
+
+    def record_rollback(self, checkpoint: int):
+        """Record that the history was truncated back to checkpoint messages."""
+        self._sent = checkpoint
+        self._write({'e': 'rollback', 'to': checkpoint})
+
+    def record_converse(self, model_id: str, messages: List[Dict], response: Dict, latency: float):
+        """Record one converse call; only messages not yet logged are written."""
+        self._write({
+            'e': 'converse',
+            'model': model_id,
+            'from': self._sent,
+            'new': messages[self._sent:],
+            'response': response.get('output', {}).get('message'),
+            'stop': response.get('stopReason'),
+            'usage': response.get('usage'),
+            'ms': round(latency * 1000, 3),
+        })
+        self._sent = len(messages) + 1 # the response is appended to the history next
+
+    def record_tool(self, payload: Dict, run: Callable[[Dict], Dict]) -> Dict:
+        """Run a tool through run(payload), recording its timing and graph mutations."""
+        before = graph_snapshot(self.state)
+        start = time.perf_counter()
+        tool_result = run(payload)
+        latency = time.perf_counter() - start
+        self._write({
+            'e': 'tool',
+            'name': payload['name'],
+            'input': payload['input'],
+            'result': tool_result['content'],
+            'status': tool_result['status'],
+            'ms': round(latency * 1000, 3),
+            'mutations': graph_diff(before, graph_snapshot(self.state)),
+        })
+        return tool_result
+
+    def close(self):
+        self._file.close()
+
+def read_session(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the events of a recorded session."""
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
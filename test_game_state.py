@@ -0,0 +1,53 @@
+import pytest
+
+from game_state import GameState
+
+@pytest.fixture
+def state():
+    state = GameState()
+    state.create_room('hall', 'A long hall')
+    state.create_room('attic')
+    state.create_room('cellar')
+    state.connect_rooms('hall', 'attic', 'up', 'down')
+    state.connect_rooms('hall', 'cellar', 'down')
+    state.create_player('player_1', 'Adventurer')
+    state.move_player('player_1', 'hall')
+    return state
+
+def test_describe_surroundings(state):
+    state.create_object('lamp', 'Brass Lamp')
+    state.add_object_to_room('lamp', 'hall')
+    state.create_object('key', 'Iron Key')
+    state.add_object_to_room('key', 'hall')
+    state.player_take_object('player_1', 'key')
+    state.create_object('rope', 'Rope')
+    state.add_object_to_room('rope', 'attic')
+    state.create_npc('cat', 'Cat')
+    state.move_npc('cat', 'hall')
+
+    assert state.describe_surroundings('player_1') == {
+        'room': 'hall',
+        'description': 'A long hall',
+        'exits': {'up': 'attic', 'down': 'cellar'},
+        'objects': ['lamp'],
+        'npcs': ['cat'],
+        'inventory': ['key'],
+    }
+
+def test_describe_surroundings_matches_single_getters(state):
+    state.move_player_direction('player_1', 'up')
+    surroundings = state.describe_surroundings('player_1')
+
+    assert surroundings['room'] == state.get_player_room('player_1')
+    assert surroundings['description'] == state.get_room_description('attic')
+    assert surroundings['exits'] == state.get_room_exits('attic')
+    assert surroundings['objects'] == state.get_room_objects('attic') == []
+    assert surroundings['npcs'] == state.get_room_npcs('attic') == []
+    assert surroundings['inventory'] == state.get_player_objects('player_1') == []
+
+def test_describe_surroundings_player_not_in_room():
+    state = GameState()
+    state.create_player('player_1', 'Adventurer')
+
+    with pytest.raises(ValueError):
+        state.describe_surroundings('player_1')
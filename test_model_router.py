@@ -0,0 +1,86 @@
+import copy
+
+import pytest
+
+from model_router import ModelMetrics, ModelRouter
+
+@pytest.fixture
+def router():
+    return ModelRouter('small', 'large', max_small_context=1000, text_only_models=('meta.',))
+
+def tool_result_message(content):
+    return {'role': 'user', 'content': [
+        {'toolResult': {'toolUseId': 'tool_1', 'content': content, 'status': 'success'}}
+    ]}
+
+@pytest.mark.parametrize('prompt,simple', [
+    ('look', True),
+    ('Go North', True),
+    ('take the brass lamp', True),
+    ('tell the barkeep a story about the dragon', False),
+    ('go to the tower and then climb the stairs to the top', False),
+    ('', False),
+])
+def test_is_simple_command(router, prompt, simple):
+    assert router.is_simple_command(prompt) == simple
+
+def test_route(router):
+    assert router.route('go north', 0) == 'small'
+    assert router.route('tell the barkeep a story about the dragon', 0) == 'large'
+    assert router.route('look', 0, world_building=True) == 'large'
+
+def test_route_switches_to_large_model_on_long_context(router):
+    assert router.route('look', 1000) == 'small'
+    assert router.route('look', 1001) == 'large'
+
+def test_route_uses_last_reported_input_tokens(router):
+    metrics = ModelMetrics()
+    metrics.record_call('large', 1.0, {'inputTokens': 5000})
+    assert router.route('look', metrics.last_input_tokens) == 'large'
+
+    # A call without usage keeps the last known size
+    metrics.record_call('large', 1.0)
+    assert metrics.last_input_tokens == 5000
+
+def test_translate_history_rewrites_json_for_text_only_models(router):
+    messages = [
+        {'role': 'user', 'content': [{'text': 'look'}]},
+        tool_result_message([{'json': {'room': 'hall', 'exits': {'up': 'attic'}}}, {'text': 'ok'}]),
+    ]
+    original = copy.deepcopy(messages)
+
+    translated = router.translate_history(messages, 'meta.llama3-8b')
+    assert translated[0] == messages[0]
+    assert translated[1]['content'][0]['toolResult']['content'] == [
+        {'text': '{"room":"hall","exits":{"up":"attic"}}'},
+        {'text': 'ok'},
+    ]
+    assert translated[1]['content'][0]['toolResult']['toolUseId'] == 'tool_1'
+    assert messages == original
+
+def test_translate_history_passes_through_other_models(router):
+    messages = [tool_result_message([{'json': {'moved': True}}])]
+    assert router.translate_history(messages, 'anthropic.claude') is messages
+    assert ModelRouter('small', 'large').translate_history(messages, 'meta.llama3-8b') is messages
+
+def test_metrics_summary():
+    metrics = ModelMetrics(prices={'large': (0.001, 0.005)})
+    metrics.record_call('large', 0.5, {'inputTokens': 1000, 'outputTokens': 100})
+    metrics.record_call('large', 0.7, {'inputTokens': 2000, 'outputTokens': 200})
+    metrics.record_call('small', 0.1, {'inputTokens': 500, 'outputTokens': 50})
+    for latency in (1.0, 2.0, 3.0, 4.0, 10.0):
+        metrics.record_turn('large', latency)
+
+    summary = metrics.summary()
+    assert summary['large'] == {
+        'calls': 2,
+        'turns': 5,
+        'p50_turn_latency': 3.0,
+        'p90_turn_latency': 4.0,
+        'input_tokens': 3000,
+        'output_tokens': 300,
+        'cost': pytest.approx(3000 * 0.001 / 1000 + 300 * 0.005 / 1000),
+    }
+    # Models without a price report no cost, and without turns no latency
+    assert summary['small']['cost'] == 0
+    assert summary['small']['p50_turn_latency'] is None
@@ -0,0 +1,208 @@
+import threading
+
+import pytest
+from botocore.exceptions import ReadTimeoutError
+
+from converse_agent import ConverseAgent
+from converse_tools import ConverseToolManager
+from game import Game
+from request_scheduler import AdaptiveLimiter, RequestScheduler, TokenBucket
+
+class Throttled(Exception):
+    """Same shape as the botocore ClientError raised for a throttled call"""
+    def __init__(self):
+        super().__init__("ThrottlingException")
+        self.response = {'Error': {'Code': 'ThrottlingException'}}
+
+def tool_use(name, tool_input):
+    return {
+        'output': {'message': {'role': 'assistant', 'content': [
+            {'toolUse': {'toolUseId': 'tool_1', 'name': name, 'input': tool_input}}
+        ]}},
+        'stopReason': 'tool_use'
+    }
+
+def end_turn(text):
+    return {
+        'output': {'message': {'role': 'assistant', 'content': [{'text': text}]}},
+        'stopReason': 'end_turn'
+    }
+
+class FakeClient:
+    """Fake bedrock-runtime client that returns or raises scripted results in order"""
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def converse(self, **kwargs):
+        self.calls += 1
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+class FakeClock:
+    """Clock whose sleep advances time instead of blocking"""
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def scheduler(max_retries=3):
+    return RequestScheduler(requests_per_second=1000, burst=1000, max_retries=max_retries, sleep=lambda seconds: None)
+
+def agent(client, max_retries=3):
+    tools = ConverseToolManager()
+    tools.register_tool('look', lambda: {'room': 'hall'}, 'Look around', {'json': {'type': 'object', 'properties': {}}})
+    agent = ConverseAgent('model', client=client, scheduler=scheduler(max_retries))
+    agent.tools = tools
+    return agent
+
+def test_throttled_call_is_retried():
+    client = FakeClient(Throttled(), Throttled(), end_turn('hello'))
+    a = agent(client)
+
+    assert a.invoke_with_prompt('hi') == 'hello'
+    assert client.calls == 3
+    assert len(a.messages) == 2
+
+def test_connection_errors_are_retried():
+    client = FakeClient(ReadTimeoutError(endpoint_url='https://bedrock'), end_turn('hello'))
+
+    assert agent(client).invoke_with_prompt('hi') == 'hello'
+    assert client.calls == 2
+
+def test_gives_up_after_max_retries():
+    client = FakeClient(Throttled())
+    a = agent(client, max_retries=2)
+
+    with pytest.raises(Throttled):
+        a.invoke_with_prompt('hi')
+    assert client.calls == 3
+
+def test_failed_tool_loop_leaves_messages_unchanged():
+    client = FakeClient(end_turn('first'))
+    a = agent(client)
+    a.invoke_with_prompt('hi')
+    before = list(a.messages)
+
+    # The tool runs, then every call that would send its result is throttled
+    client.results = [tool_use('look', {}), Throttled()]
+    with pytest.raises(Throttled):
+        a.invoke_with_prompt('look around')
+    assert a.messages == before
+
+def test_failed_turn_restores_game_state():
+    game = Game()
+    game.agent.scheduler = scheduler()
+    game.agent.client = FakeClient(end_turn('<response>ready</response>'))
+    game.start_game('fantasy')
+
+    game.agent.client = FakeClient(tool_use('create_room', {'room_id': 'vault'}), Throttled())
+    with pytest.raises(Throttled):
+        game.process_command('build a vault')
+    assert not game.state.graph.has_node('vault')
+    assert len(game.agent.messages) == 2
+
+    # Retrying the turn can create the room again
+    game.agent.client = FakeClient(tool_use('create_room', {'room_id': 'vault'}), end_turn('<response>done</response>'))
+    response, _, _ = game.process_command('build a vault')
+    assert response == 'done'
+    assert game.state.graph.has_node('vault')
+
+def test_token_bucket_allows_burst_then_waits():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now += 0.5
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    # Refill never exceeds the burst capacity
+    clock.now += 60
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() > 0
+
+def test_scheduler_waits_for_rate_limit():
+    clock = FakeClock()
+    s = RequestScheduler(requests_per_second=1, burst=1, sleep=clock.sleep, clock=clock)
+
+    for _ in range(3):
+        s.call('model', lambda: 'ok')
+    assert clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+
+def test_rate_limit_is_per_model():
+    clock = FakeClock()
+    s = RequestScheduler(requests_per_second=1, burst=1, sleep=clock.sleep, clock=clock)
+
+    s.call('small', lambda: 'ok')
+    s.call('large', lambda: 'ok')
+    assert clock.sleeps == []
+
+def test_limiter_halves_on_throttle_and_grows_back():
+    limiter = AdaptiveLimiter(max_concurrency=8)
+
+    for expected in (4, 2, 1, 1):
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.limit == expected
+
+    # Additive increase: roughly one more slot per window of successes
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release()
+    assert int(limiter.limit) == 2
+
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+def test_scheduler_throttle_shrinks_shared_limit():
+    clock = FakeClock()
+    s = RequestScheduler(requests_per_second=1000, burst=1000, max_concurrency=4,
+                         sleep=clock.sleep, clock=clock, jitter=lambda: 1.0)
+    client = FakeClient(Throttled(), Throttled(), end_turn('hello'))
+
+    s.call('model', client.converse)
+    assert s.limiter.limit < 4
+    assert s.limiter.in_flight == 0
+    # Full jitter backoff with jitter fixed at 1: base_delay * 2 ** attempt
+    assert clock.sleeps == [0.5, 1.0]
+
+def test_limiter_blocks_callers_over_the_limit():
+    limiter = AdaptiveLimiter(max_concurrency=2)
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 1
+
+    limiter.acquire()
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    waiter.start()
+    assert not acquired.wait(0.1)
+
+    limiter.release()
+    assert acquired.wait(1)
+    waiter.join()
+    limiter.release()
+    assert limiter.in_flight == 0